@@ -2,11 +2,14 @@ import pygame
 from pygame import Color as pgClr
 
 import os
+import struct
+import time
 
 from typing import Union, Optional, Callable, Iterable, Any
 
 pygame.init()
 mouse_in_use = False
+replay_frame = None
 
 
 def do_nothing():
@@ -15,25 +18,179 @@ def do_nothing():
 
 def update_mouse():
     global mouse_in_use
-    if not pygame.mouse.get_pressed()[0]:
+    if not get_mouse_pressed()[0]:
         mouse_in_use = False
 
 
-class Label:
+def get_mouse_pressed() -> tuple[bool, bool, bool]:
+    if replay_frame is not None:
+        return replay_frame.pressed
+    return pygame.mouse.get_pressed()
+
+
+def get_mouse_pos() -> tuple[int, int]:
+    if replay_frame is not None:
+        return replay_frame.mouse_position
+    return pygame.mouse.get_pos()
+
+
+def set_cursor(cursor: int):
+    if replay_frame is None:
+        pygame.mouse.set_cursor(cursor)
+
+
+DEFAULT_STYLE_SHEET = {
+    "Label": {
+        "foreground": "#000000",
+        "background": None
+    },
+    "TextInput": {
+        "background": "#e7e7e7",
+        "foreground": "#000000",
+        "border_color": "#000000",
+        "cursor_color": "#000000"
+    },
+    "Button": {
+        "background": ("#efefef", "#e5e5e5", "#f5f5f5", "#f7f7f7"),
+        "foreground": ("#000000", "#000000", "#000000", "#383838"),
+        "border_color": ("#000000", "#000000", "#000000", "#383838")
+    },
+    "ToggleableButton": {
+        "background": ("#efefef", "#e5e5e5", "#0a0a0a", "#000000", "#f7f7f7"),
+        "foreground": ("#0a0a0a", "#000000", "#efefef", "#e5e5e5", "#383838"),
+        "border_color": ("#0a0a0a", "#000000", "#efefef", "#e5e5e5", "#383838")
+    },
+    "Slider": {
+        "color": "#000000"
+    },
+    "ScrollBar": {
+        "background": "#f1f1f1",
+        "slider_color": ("#c1c1c1", "#a8a8a8", "#787878")
+    },
+    "FilesScreen": {
+        "title_bar_color": "#efefef",
+        "title_color": "#000000",
+        "bottom_area_color": "#f0f0f0",
+        "files_area_color": "#ffffff",
+        "border_color": "#000000"
+    },
+    "QuitButton": {
+        "background": ("#efefef", "#ff4444", "#444444"),
+        "foreground": ("#000000", "#efefef", "#ffffff")
+    },
+    "FileButton": {
+        "background": ("#ffffff", "#e5f3ff", "#cce8ff", "#cce8ff"),
+        "foreground": ("#000000", "#000000", "#000000", "#000000"),
+        "border_color": ("#ffffff", "#e5f3ff", "#99d1ff", "#99d1ff")
+    }
+}
+
+
+def compile_color(value: Any) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, (str, pgClr)):
+        return pgClr(value)
+    if all(isinstance(v, int) for v in value):
+        return pgClr(*value)
+    return tuple(compile_color(v) for v in value)
+
+
+class Theme:
+    def __init__(self, style_sheet: dict[str, dict[str, Any]]):
+        self.style_sheet = style_sheet
+        self.styles = {
+            name: {prop: compile_color(value) for prop, value in style.items()}
+            for name, style in style_sheet.items()
+        }
+
+    def extend(self, style_sheet: dict[str, dict[str, Any]]) -> "Theme":
+        merged = {name: dict(style) for name, style in self.style_sheet.items()}
+        for name, style in style_sheet.items():
+            merged.setdefault(name, {}).update(style)
+        return Theme(merged)
+
+    def lookup(self, widget: Any, prop: str, style: Optional[str] = None) -> Any:
+        names = [cls.__name__ for cls in type(widget).__mro__]
+        if style is not None:
+            names.insert(0, style)
+
+        for name in names:
+            if prop in self.styles.get(name, {}):
+                return self.styles[name][prop]
+        raise KeyError(f"no style for '{prop}' of {type(widget).__name__}")
+
+
+theme = Theme(DEFAULT_STYLE_SHEET)
+
+
+def set_theme(new_theme: Theme):
+    global theme
+    theme = new_theme
+
+
+class Themed:
+    def init_theme(self, style: Optional[str] = None, **overrides: Any):
+        self.style = style
+        self.style_overrides = overrides
+        self.skins = {}
+        self.apply_theme()
+
+    def __setattr__(self, name: str, value: Any):
+        # Colours are compiled once on assignment, into copies owned by this widget.
+        if name in self.__dict__.get("style_overrides", {}):
+            value = compile_color(value)
+            if isinstance(value, tuple):
+                value = list(value)
+        super().__setattr__(name, value)
+
+    def apply_theme(self):
+        self.theme = theme
+        for prop, value in self.style_overrides.items():
+            if value is None:
+                value = theme.lookup(self, prop, self.style)
+            setattr(self, prop, value)
+        self.invalidate_skins()
+
+    def check_theme(self):
+        if self.theme is not theme:
+            self.apply_theme()
+
+    def invalidate_skins(self):
+        self.skins = {}
+
+    def cached_skin(self, name: Any, key: tuple, build: Callable[[], pygame.Surface]) -> pygame.Surface:
+        if name not in self.skins or self.skins[name][0] != key:
+            self.skins[name] = (key, build())
+        return self.skins[name][1]
+
+
+def color_key(color: Union[str, pgClr, None]) -> Optional[tuple[int, int, int, int]]:
+    if color is None:
+        return None
+    if isinstance(color, pgClr):
+        return tuple(color)
+    return tuple(pgClr(color))
+
+
+class Label(Themed):
     def __init__(
         self, position: Union[tuple[float, float], list[float, float]],
         text: str = "",
         font: pygame.font.Font = pygame.font.Font("freesansbold.ttf", 20),
-        foreground: Union[str, pgClr] = "#000000",
-        background: Union[str, pgClr, None] = None
+        foreground: Union[str, pgClr, None] = None,
+        background: Union[str, pgClr, None] = None,
+        style: Optional[str] = None
     ):
         self.position = position
         self.text = text
-        self.foreground = foreground
-        self.background = background
         self.font = font
 
+        self.init_theme(style, foreground=foreground, background=background)
+
     def draw(self, screen: pygame.Surface):
+        self.check_theme()
+
         text = self.font.render(self.text, True, self.foreground)
         text_rect = text.get_rect()
         text_rect.midleft = self.position
@@ -44,17 +201,19 @@ class Label:
         screen.blit(text, text_rect)
 
 
-class TextInput:
+class TextInput(Themed):
     def __init__(
         self, position: Union[tuple[float, float], list[float, float]],
         length: float = 175,
         font: pygame.font.Font = pygame.font.Font("freesansbold.ttf", 20),
-        background: Union[str, pgClr] = "#e7e7e7",
-        foreground: Union[str, pgClr] = "#000000",
-        border_color: Union[str, pgClr] = "#000000",
+        background: Union[str, pgClr, None] = None,
+        foreground: Union[str, pgClr, None] = None,
+        border_color: Union[str, pgClr, None] = None,
         border_width: int = 1,
         border_radius: int = 4,
-        padding: float = 2
+        padding: float = 2,
+        cursor_color: Union[str, pgClr, None] = None,
+        style: Optional[str] = None
     ):
         self.font = font
 
@@ -66,13 +225,13 @@ class TextInput:
         self.surface_rect = self.surface.get_rect()
         self.surface_rect.center = self.position
 
-        self.background = background
-        self.foreground = foreground
-        self.border_color = border_color
         self.border_width = border_width
         self.border_radius = border_radius
         self.padding = padding
 
+        self.init_theme(style, background=background, foreground=foreground, border_color=border_color,
+                        cursor_color=cursor_color)
+
         self.text = ""
 
         self.invalid_chars = []
@@ -83,23 +242,39 @@ class TextInput:
     def draw(self, screen: pygame.Surface):
         screen.blit(self.surface, self.surface_rect)
 
+    def get_skin(self, active: bool) -> pygame.Surface:
+        def build():
+            rect = pygame.Rect(0, 0, self.width, self.height)
+            skin = pygame.Surface(rect.size, pygame.SRCALPHA)
+            pygame.draw.rect(skin, self.background, rect, 0, self.border_radius)
+            pygame.draw.rect(skin, self.border_color, rect, self.border_width, self.border_radius)
+            if active:
+                pygame.draw.rect(skin, self.border_color, rect, self.border_width + 1, 4)
+            return skin
+
+        key = (color_key(self.background), color_key(self.border_color), self.border_width, self.border_radius,
+               self.width, self.height)
+        return self.cached_skin(active, key, build)
+
+    def show_skin(self, active: bool):
+        self.surface.fill((0, 0, 0, 0))
+        self.surface.blit(self.get_skin(active), (0, 0))
+
     def update(self, mouse_position: tuple[float, float], event: pygame.event.Event):
         global mouse_in_use
 
-        pygame.draw.rect(self.surface, self.background, pygame.Rect(0, 0, self.width, self.height), 0,
-                         self.border_radius)
-        pygame.draw.rect(self.surface, self.border_color, pygame.Rect(0, 0, self.width, self.height),
-                         self.border_width, self.border_radius)
+        self.check_theme()
+        self.show_skin(False)
 
         if self.surface_rect.collidepoint(mouse_position) and not mouse_in_use:
-            pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_IBEAM)
-            if pygame.mouse.get_pressed()[0]:
+            set_cursor(pygame.SYSTEM_CURSOR_IBEAM)
+            if get_mouse_pressed()[0]:
                 self.is_active = True
                 self.cursor_position = len(self.text)
                 mouse_in_use = True
         if not self.surface_rect.collidepoint(mouse_position):
-            pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
-            if pygame.mouse.get_pressed()[0]:
+            set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+            if get_mouse_pressed()[0]:
                 self.is_active = False
                 mouse_in_use = True
 
@@ -129,23 +304,20 @@ class TextInput:
                 if event.key == pygame.K_RETURN:
                     self.is_active = False
 
-            pygame.draw.rect(
-                self.surface, self.border_color, pygame.Rect(0, 0, self.width, self.height), self.border_width + 1,
-                4
-            )
-            x = self.font.render(self.text[:self.cursor_position], True, "#000000").get_rect().width + 3
+            self.show_skin(True)
+            x = self.font.size(self.text[:self.cursor_position])[0] + 3
             x_ = x
             if x > self.width:
                 txt = self.font.render(self.text[:self.cursor_position], True, self.foreground)
                 txt_rect = txt.get_rect()
                 txt_rect.midright = (self.width - 3 - self.padding, self.height / 2)
                 x_ = self.width - 3 - self.padding
-            pygame.draw.line(self.surface, "#000000", (x_, self.height / 7), (x_, 6 * self.height / 7), 1)
+            pygame.draw.line(self.surface, self.cursor_color, (x_, self.height / 7), (x_, 6 * self.height / 7), 1)
 
         self.surface.blit(txt, txt_rect)
 
 
-class Button:
+class Button(Themed):
     def __init__(
         self, size: Union[tuple[float, float], list[float, float]],
         position: Union[tuple[float, float], list[float, float]],
@@ -155,36 +327,37 @@ class Button:
 
         background: Union[
             tuple[str, str, str, str], list[str, str, str, str],
-            tuple[pgClr, pgClr, pgClr, pgClr], list[pgClr, pgClr, pgClr, pgClr]
-        ] = ("#efefef", "#e5e5e5", "#f5f5f5", "#f7f7f7"),
+            tuple[pgClr, pgClr, pgClr, pgClr], list[pgClr, pgClr, pgClr, pgClr], None
+        ] = None,
 
         foreground: Union[
             tuple[str, str, str, str], list[str, str, str, str],
-            tuple[pgClr, pgClr, pgClr, pgClr], list[pgClr, pgClr, pgClr, pgClr]
-        ] = ("#000000", "#000000", "#000000", "#383838"),
+            tuple[pgClr, pgClr, pgClr, pgClr], list[pgClr, pgClr, pgClr, pgClr], None
+        ] = None,
 
         border_color: Union[
             tuple[str, str, str, str], list[str, str, str, str],
-            tuple[pgClr, pgClr, pgClr, pgClr], list[pgClr, pgClr, pgClr, pgClr]
-        ] = ("#000000", "#000000", "#000000", "#383838"),
+            tuple[pgClr, pgClr, pgClr, pgClr], list[pgClr, pgClr, pgClr, pgClr], None
+        ] = None,
 
         border_width: int = 1,
         border_radius: int = 4,
         disabled: bool = False,
         command: Callable = do_nothing,
-        args: Iterable[Any] = ()
+        args: Iterable[Any] = (),
+        style: Optional[str] = None
     ):
         self.surface = pygame.Surface(size, pygame.SRCALPHA)
         self.surface_rect = self.surface.get_rect()
         self.surface_rect.center = position
         self.rect = pygame.Rect(0, 0, size[0], size[1])
-        self.background = list(background)
-        self.foreground = list(foreground)
-        self.border_color = list(border_color)
 
         self.border_width = border_width
         self.border_radius = border_radius
 
+        self.shown_skin = None
+        self.init_theme(style, background=background, foreground=foreground, border_color=border_color)
+
         self.image = pygame.Surface((0, 0))
         if image is not None:
             self.image = image
@@ -213,19 +386,23 @@ class Button:
         self.text_surface = pygame.Surface((0, 0))
         if self.text is not None:
             self.text_surface = self.font.render(self.text, True, self.foreground[0])
+        self.invalidate_skins()
 
     def set_text_color(self, color: Union[str, pgClr]):
         if self.text is not None:
             self.text_surface = self.font.render(self.text, True, color)
 
-    def draw_foreground(self):
+    def draw_foreground(self, surface: Optional[pygame.Surface] = None):
+        if surface is None:
+            surface = self.surface
+
         width = self.image.get_width()
         if self.text_surface.get_width() > width:
             width = self.text_surface.get_width()
         height = self.image.get_height()+self.text_surface.get_height()+6
         foreground_surface = pygame.Surface((width, height), pygame.SRCALPHA)
         foreground_rect = foreground_surface.get_rect()
-        foreground_rect.center = (self.surface.get_width()/2, self.surface.get_height()/2)
+        foreground_rect.center = (surface.get_width()/2, surface.get_height()/2)
 
         image_rect = self.image.get_rect()
         image_rect.midtop = (width/2, 2)
@@ -235,44 +412,52 @@ class Button:
         text_rect.midbottom = (width/2, height-2)
         foreground_surface.blit(self.text_surface, text_rect)
 
-        self.surface.blit(foreground_surface, foreground_rect)
+        surface.blit(foreground_surface, foreground_rect)
+
+    def get_skin(self, state: int) -> pygame.Surface:
+        def build():
+            skin = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+            pygame.draw.rect(skin, self.background[state], self.rect, 0, self.border_radius)
+            pygame.draw.rect(skin, self.border_color[state], self.rect, self.border_width, self.border_radius)
+            self.set_text_color(self.foreground[state])
+            self.draw_foreground(skin)
+            return skin
+
+        key = (color_key(self.background[state]), color_key(self.border_color[state]),
+               color_key(self.foreground[state]), self.border_width, self.border_radius, tuple(self.rect),
+               self.image, self.font, self.text)
+        return self.cached_skin(state, key, build)
+
+    def show_skin(self, state: int):
+        skin = self.get_skin(state)
+        if skin is not self.shown_skin:
+            self.surface.fill((0, 0, 0, 0))
+            self.surface.blit(skin, (0, 0))
+            self.shown_skin = skin
 
     def update(self, mouse_position: tuple[float, float]):
         global mouse_in_use
 
+        self.check_theme()
         if self.disabled:
-            pygame.draw.rect(self.surface, self.background[3], self.rect, 0, self.border_radius)
-            pygame.draw.rect(self.surface, self.border_color[3], self.rect, self.border_width, self.border_radius)
-            self.set_text_color(self.foreground[3])
-            self.draw_foreground()
+            self.show_skin(3)
             if self.surface_rect.collidepoint(mouse_position):
-                pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_NO)
+                set_cursor(pygame.SYSTEM_CURSOR_NO)
             else:
-                pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+                set_cursor(pygame.SYSTEM_CURSOR_ARROW)
         else:
             if self.surface_rect.collidepoint(mouse_position) and not mouse_in_use:
-                if pygame.mouse.get_pressed()[0] and not self.clicked:
-                    pygame.draw.rect(self.surface, self.background[2], self.rect, 0, self.border_radius)
-                    pygame.draw.rect(self.surface, self.border_color[2], self.rect,
-                                     self.border_width, self.border_radius)
-                    self.set_text_color(self.foreground[2])
-                    self.draw_foreground()
+                if get_mouse_pressed()[0] and not self.clicked:
+                    self.show_skin(2)
 
                     self.command(*self.command_args)
                     self.clicked = True
                     mouse_in_use = True
 
-                if not pygame.mouse.get_pressed()[0]:
-                    pygame.draw.rect(self.surface, self.background[1], self.rect, 0, self.border_radius)
-                    pygame.draw.rect(self.surface, self.border_color[1], self.rect,
-                                     self.border_width, self.border_radius)
-                    self.set_text_color(self.foreground[1])
-                    self.draw_foreground()
+                if not get_mouse_pressed()[0]:
+                    self.show_skin(1)
             else:
-                pygame.draw.rect(self.surface, self.background[0], self.rect, 0, self.border_radius)
-                pygame.draw.rect(self.surface, self.border_color[0], self.rect, self.border_width, self.border_radius)
-                self.set_text_color(self.foreground[0])
-                self.draw_foreground()
+                self.show_skin(0)
 
                 self.clicked = False
 
@@ -287,31 +472,33 @@ class ToggleableButton(Button):
 
         background: Union[
             tuple[str, str, str, str, str], list[str, str, str, str, str],
-            tuple[pgClr, pgClr, pgClr, pgClr, pgClr], list[pgClr, pgClr, pgClr, pgClr, pgClr]
-        ] = ("#efefef", "#e5e5e5", "#0a0a0a", "#000000", "#f7f7f7"),
+            tuple[pgClr, pgClr, pgClr, pgClr, pgClr], list[pgClr, pgClr, pgClr, pgClr, pgClr], None
+        ] = None,
 
         foreground: Union[
-            tuple[str, str, str, str], list[str, str, str, str],
-            tuple[pgClr, pgClr, pgClr, pgClr], list[pgClr, pgClr, pgClr, pgClr]
-        ] = ("#0a0a0a", "#000000", "#efefef", "#e5e5e5", "#383838"),
+            tuple[str, str, str, str, str], list[str, str, str, str, str],
+            tuple[pgClr, pgClr, pgClr, pgClr, pgClr], list[pgClr, pgClr, pgClr, pgClr, pgClr], None
+        ] = None,
 
         border_color: Union[
-            tuple[str, str, str, str], list[str, str, str, str],
-            tuple[pgClr, pgClr, pgClr, pgClr], list[pgClr, pgClr, pgClr, pgClr]
-        ] = ("#0a0a0a", "#000000", "#efefef", "#e5e5e5", "#383838"),
+            tuple[str, str, str, str, str], list[str, str, str, str, str],
+            tuple[pgClr, pgClr, pgClr, pgClr, pgClr], list[pgClr, pgClr, pgClr, pgClr, pgClr], None
+        ] = None,
 
         border_width: int = 1,
         border_radius: int = 4,
         disabled: bool = False,
         command: Callable = do_nothing,
-        args: Iterable[Any] = ()
+        args: Iterable[Any] = (),
+        style: Optional[str] = None
     ):
         super().__init__(
             size, position,
             image, text, font,
             background, foreground,
             border_color, border_width, border_radius,
-            disabled, command, args
+            disabled, command, args,
+            style
         )
         self.is_active = False
 
@@ -320,13 +507,10 @@ class ToggleableButton(Button):
     def update(self, mouse_position: tuple[float, float]):
         global mouse_in_use
 
+        self.check_theme()
         if self.disabled:
             self.is_active = False
-            pygame.draw.rect(self.surface, self.background[4], self.rect, 0, self.border_radius)
-            pygame.draw.rect(self.surface, self.border_color[4], self.rect, self.border_width,
-                             self.border_radius)
-            self.set_text_color(self.foreground[4])
-            self.draw_foreground()
+            self.show_skin(4)
 
         else:
             if self.is_active:
@@ -334,19 +518,11 @@ class ToggleableButton(Button):
 
             if self.surface_rect.collidepoint(mouse_position) and not mouse_in_use:
                 if self.is_active:
-                    pygame.draw.rect(self.surface, self.background[3], self.rect, 0, self.border_radius)
-                    pygame.draw.rect(self.surface, self.border_color[3], self.rect, self.border_width,
-                                     self.border_radius)
-                    self.set_text_color(self.foreground[3])
-                    self.draw_foreground()
+                    self.show_skin(3)
                 else:
-                    pygame.draw.rect(self.surface, self.background[1], self.rect, 0, self.border_radius)
-                    pygame.draw.rect(self.surface, self.border_color[1], self.rect, self.border_width,
-                                     self.border_radius)
-                    self.set_text_color(self.foreground[1])
-                    self.draw_foreground()
+                    self.show_skin(1)
 
-                if pygame.mouse.get_pressed()[0] and not self.clicked:
+                if get_mouse_pressed()[0] and not self.clicked:
                     is_active = False
                     if not self.is_active:
                         for btn in self.linked_with:
@@ -357,23 +533,15 @@ class ToggleableButton(Button):
                     self.clicked = True
             else:
                 if self.is_active:
-                    pygame.draw.rect(self.surface, self.background[2], self.rect, 0, self.border_radius)
-                    pygame.draw.rect(self.surface, self.border_color[2], self.rect, self.border_width,
-                                     self.border_radius)
-                    self.set_text_color(self.foreground[2])
-                    self.draw_foreground()
+                    self.show_skin(2)
                 else:
-                    pygame.draw.rect(self.surface, self.background[0], self.rect, 0, self.border_radius)
-                    pygame.draw.rect(self.surface, self.border_color[0], self.rect, self.border_width,
-                                     self.border_radius)
-                    self.set_text_color(self.foreground[0])
-                    self.draw_foreground()
+                    self.show_skin(0)
 
-            if not pygame.mouse.get_pressed()[0]:
+            if not get_mouse_pressed()[0]:
                 self.clicked = False
 
 
-class Slider:
+class Slider(Themed):
     def __init__(
         self, position: Union[tuple[float, float], list[float, float]],
         label: str = "",
@@ -382,7 +550,8 @@ class Slider:
         max_value: int = 100,
         length: int = 170,
         line_width: int = 6,
-        color: Union[str, pgClr] = "#000000"
+        color: Union[str, pgClr, None] = None,
+        style: Optional[str] = None
     ):
         self.position = position
 
@@ -397,25 +566,34 @@ class Slider:
 
         self.blob_x = self.position[0]-4
 
-        self.color = color
-
         self.clicked = False
 
         self.length = length
         self.line_width = line_width
 
+        self.init_theme(style, color=color)
+
     def set_value(self, value):
         self.value = value
         self.blob_x = self.position[0]-4+self.length*(value-self.min_value)/(self.max_value-self.min_value)
 
+    def get_skin(self) -> pygame.Surface:
+        def build():
+            skin = pygame.Surface((self.length, self.line_width))
+            pygame.draw.line(skin, self.color, (0, 0), (self.length, 0), self.line_width)
+            skin.set_alpha(150)
+            return skin
+
+        key = (color_key(self.color), self.length, self.line_width)
+        return self.cached_skin("track", key, build)
+
     def draw(self, screen):
+        self.check_theme()
+
         label = self.font.render(self.label + ": " + str(self.value), True, self.color)
         screen.blit(label, (self.position[0], self.position[1]-self.font.get_height()-12))
 
-        surface = pygame.Surface((self.length, self.line_width))
-        pygame.draw.line(surface, self.color, (0, 0), (self.length, 0), self.line_width)
-        surface.set_alpha(150)
-        screen.blit(surface, self.position)
+        screen.blit(self.get_skin(), self.position)
 
         pygame.draw.rect(screen, self.color, pygame.Rect(self.blob_x, self.position[1]-5, 8, 16))
         pygame.draw.circle(screen, self.color, (self.blob_x+4, self.position[1]-5), 4)
@@ -426,13 +604,13 @@ class Slider:
 
         cdtn = pygame.Rect(self.position[0], self.position[1]-9, self.length, 15).collidepoint(mouse_position)
         if cdtn and not mouse_in_use:
-            if pygame.mouse.get_pressed()[0]:
+            if get_mouse_pressed()[0]:
                 self.clicked = True
                 mouse_in_use = True
-        if not pygame.mouse.get_pressed()[0]:
+        if not get_mouse_pressed()[0]:
             self.clicked = False
         if self.clicked:
-            self.blob_x = pygame.mouse.get_pos()[0]-4
+            self.blob_x = get_mouse_pos()[0]-4
             if self.blob_x < self.position[0]-4:
                 self.blob_x = self.position[0]-4
             if self.blob_x > self.position[0]+self.length-4:
@@ -440,18 +618,19 @@ class Slider:
         self.value = int(self.min_value+(self.max_value-self.min_value)*(self.blob_x-self.position[0]+4)/self.length)
 
 
-class ScrollBar:
+class ScrollBar(Themed):
     def __init__(
         self, position: Union[tuple[float, float], list[float, float]],
         width: int,
         height: int,
         linked_to: pygame.Surface,
         clipping_height: int,
-        background: Union[str, pgClr] = "#f1f1f1",
+        background: Union[str, pgClr, None] = None,
         slider_color: Union[
             tuple[str, str, str], list[str, str, str],
-            tuple[pgClr, pgClr, pgClr], list[pgClr, pgClr, pgClr]
-        ] = ("#c1c1c1", "#a8a8a8", "#787878")
+            tuple[pgClr, pgClr, pgClr], list[pgClr, pgClr, pgClr], None
+        ] = None,
+        style: Optional[str] = None
     ):
         self.surface = pygame.Surface((width, height))
         self.surface_rect = self.surface.get_rect()
@@ -465,8 +644,7 @@ class ScrollBar:
         self.clicked = False
         self.rel = [0, 0]
 
-        self.background = background
-        self.slider_color = slider_color
+        self.init_theme(style, background=background, slider_color=slider_color)
 
     def draw(self, screen):
         screen.blit(self.surface, self.surface_rect)
@@ -474,17 +652,18 @@ class ScrollBar:
     def update(self, mouse_position):
         global mouse_in_use
 
+        self.check_theme()
         self.surface.fill(self.background)
         if self.slider.collidepoint(mouse_position[0]-self.surface_rect.left, mouse_position[1]-self.surface_rect.top) and not mouse_in_use:
             pygame.draw.rect(self.surface, self.slider_color[1], self.slider)
-            if pygame.mouse.get_pressed()[0] and not self.clicked:
+            if get_mouse_pressed()[0] and not self.clicked:
                 self.clicked = True
                 mouse_in_use = True
                 self.rel = self.slider.top-mouse_position[1]
         else:
             pygame.draw.rect(self.surface, self.slider_color[0], self.slider)
 
-        if not pygame.mouse.get_pressed()[0]:
+        if not get_mouse_pressed()[0]:
             self.clicked = False
 
         if self.clicked:
@@ -500,11 +679,12 @@ class ScrollBar:
                            self.linked_to.get_width(), self.clipping_height)
 
 
-class FilesScreen:
+class FilesScreen(Themed):
     def __init__(self, size: Union[tuple[int, int], list[int, int]],
                  position: Union[tuple[int, int], list[int, int]],
                  folder: str,
-                 open_or_save: str):
+                 open_or_save: str,
+                 style: Optional[str] = None):
         self.quit = False
         if open_or_save not in ["open", "save"]:
             self.quit = True
@@ -519,20 +699,17 @@ class FilesScreen:
 
         self.title_bar_height = 30
         self.title_bar = pygame.Surface((self.size[0], self.title_bar_height))
-        self.title_bar.fill("#efefef")
         self.titleBar_Rect = self.title_bar.get_rect()
         self.titleBar_Rect.topleft = (0, 0)
 
         self.quit_button = Button(
             (40, 30), (self.size[0]-20, 15),
             text="X", font=pygame.font.SysFont("arial", 20, bold=True),
-            background=["#efefef", "#ff4444", "#444444"], foreground=["#000000", "#efefef", "#ffffff"],
-            border_width=1, border_radius=0, command=self.exit
+            border_width=1, border_radius=0, command=self.exit, style="QuitButton"
         )
 
-        self.title = pygame.font.SysFont("calibri", 25, bold=True).render(open_or_save.upper(), False, "#000000")
-        self.title_rect = self.title.get_rect()
-        self.title_rect.midleft = (10, self.title_bar_height / 2)
+        self.title_font = pygame.font.SysFont("calibri", 25, bold=True)
+        self.title_text = open_or_save.upper()
 
         self.title_bar_clicked = False
         self.rel = 0
@@ -540,7 +717,6 @@ class FilesScreen:
 
         self.bottomArea_height = 90
         self.bottom_area = pygame.Surface((self.size[0], self.bottomArea_height))
-        self.bottom_area.fill("#f0f0f0")
 
         self.label_fileName = Label((10, 30), text="File Name: ", font=pygame.font.SysFont("calibri", 23))
         self.text_input = TextInput((50+self.size[0]/2, 30), length=380)
@@ -548,7 +724,6 @@ class FilesScreen:
         self.ok_button = Button((80, 20), (360, 65), text="OK", command=lambda: self.exit(True))
         self.cancel_button = Button((80, 20), (460, 65), text="CANCEL", command=lambda: self.exit(False))
 
-        self.text_input.draw(self.bottom_area)
         self.text_input.invalid_chars = ["\\", "/", "|", ":", "*", "<", ">", "?", "\""]
 
         # ______________________________________________________________________________________________________________
@@ -561,7 +736,6 @@ class FilesScreen:
             height = 200 + ((len(self.files)-1)//3)*180
         self.files_surface = pygame.Surface((self.size[0]-20, height))
         self.files_surface_clip = pygame.Rect(0, 0, self.size[0]-20, self.filesSurface_height)
-        self.files_surface.fill("#ffffff")
 
         self.button_images = []
 
@@ -580,11 +754,9 @@ class FilesScreen:
             image=self.button_images[i],
             text=self.files[i][:-4],
             font=pygame.font.Font("freesansbold.ttf", 17),
-            background=["#ffffff", "#e5f3ff", "#cce8ff", "#cce8ff"],
-            foreground=["#000000", "#000000", "#000000", "#000000"],
-            border_color=["#ffffff", "#e5f3ff", "#99d1ff", "#99d1ff"],
             border_width=2,
             border_radius=0,
+            style="FileButton"
         ) for i in range(len(self.files))]
         for i in range(len(self.file_buttons)):
             self.file_buttons[i].linked_with = self.file_buttons[:i] + self.file_buttons[i + 1:]
@@ -595,10 +767,26 @@ class FilesScreen:
         self.scroll_bar = ScrollBar((500, self.title_bar_height), 20, self.filesSurface_height,
                                     self.files_surface, self.filesSurface_height)
 
+        self.init_theme(style, title_bar_color=None, title_color=None, bottom_area_color=None,
+                        files_area_color=None, border_color=None)
+
+    def apply_theme(self):
+        super().apply_theme()
+
+        self.title_bar.fill(self.title_bar_color)
+        self.title = self.title_font.render(self.title_text, False, self.title_color)
+        self.title_rect = self.title.get_rect()
+        self.title_rect.midleft = (10, self.title_bar_height / 2)
+
+        self.bottom_area.fill(self.bottom_area_color)
+        self.text_input.draw(self.bottom_area)
+
+        self.files_surface.fill(self.files_area_color)
+
     def draw_titleBar(self):
         self.screen.blit(self.title_bar, self.titleBar_Rect)
         self.title_bar.blit(self.title, self.title_rect)
-        pygame.draw.rect(self.title_bar, "#000000", self.titleBar_Rect, 1)
+        pygame.draw.rect(self.title_bar, self.border_color, self.titleBar_Rect, 1)
 
     def draw_files_surface(self):
         self.screen.blit(self.files_surface.subsurface(self.files_surface_clip), (0, self.title_bar_height))
@@ -608,7 +796,7 @@ class FilesScreen:
 
     def draw(self, screen):
         screen.blit(self.screen, self.screen_rect)
-        pygame.draw.rect(screen, "#000000", pygame.Rect(self.position, self.size), 1)
+        pygame.draw.rect(screen, self.border_color, pygame.Rect(self.position, self.size), 1)
         self.text_input.draw(self.bottom_area)
 
     def update_title_bar(self, mouse_position):
@@ -619,11 +807,11 @@ class FilesScreen:
         self.quit_button.update(mouse_pos)
 
         if self.titleBar_Rect.collidepoint(mouse_pos):
-            if pygame.mouse.get_pressed()[0] and not self.title_bar_clicked:
+            if get_mouse_pressed()[0] and not self.title_bar_clicked:
                 self.rel = mouse_pos
                 self.title_bar_clicked = True
 
-        if not pygame.mouse.get_pressed()[0]:
+        if not get_mouse_pressed()[0]:
             self.title_bar_clicked = False
 
         if self.title_bar_clicked:
@@ -664,6 +852,7 @@ class FilesScreen:
         self.text_input.update(mouse_pos, event)
 
     def update(self, mouse_position, event):
+        self.check_theme()
         self.update_title_bar(mouse_position)
         self.update_files_surface(mouse_position)
         self.update_bottom_area(mouse_position, event)
@@ -675,3 +864,182 @@ class FilesScreen:
         if ok_clicked:
             self.return_value += self.text_input.text
         self.quit = True
+
+
+class InputFrame:
+    def __init__(self, dt: float, mouse_position: tuple[int, int], pressed: tuple[bool, bool, bool],
+                 events: list[pygame.event.Event]):
+        self.dt = dt
+        self.mouse_position = mouse_position
+        self.pressed = pressed
+        self.events = events
+
+
+class InputRecorder:
+    MAGIC = b"PGIR\x02"
+    FRAME = struct.Struct("<IhhBH")
+    EVENT = struct.Struct("<IB")
+
+    def __init__(self, path: str):
+        self.file = open(path, "wb")
+        self.file.write(self.MAGIC)
+
+    def encode_value(self, value: Any) -> Optional[bytes]:
+        if value is None:
+            return b"n"
+        if isinstance(value, bool):
+            return b"?" + struct.pack("<B", value)
+        if isinstance(value, int):
+            if not -2 ** 63 <= value < 2 ** 63:
+                return None
+            return b"q" + struct.pack("<q", value)
+        if isinstance(value, float):
+            return b"d" + struct.pack("<d", value)
+        if isinstance(value, str):
+            text = value.encode("utf-8")
+            if len(text) >= 2 ** 32:
+                return None
+            return b"s" + struct.pack("<I", len(text)) + text
+        if isinstance(value, (tuple, list)):
+            if len(value) > 255:
+                return None
+            items = [self.encode_value(item) for item in value]
+            if None in items:
+                return None
+            return b"t" + struct.pack("<B", len(items)) + b"".join(items)
+        return None
+
+    def encode_event(self, event: pygame.event.Event) -> bytes:
+        fields = []
+        for name, value in event.dict.items():
+            name = name.encode("utf-8")
+            encoded = self.encode_value(value)
+            if encoded is not None and len(name) <= 255:
+                fields.append(struct.pack("<B", len(name)) + name + encoded)
+        if len(fields) > 255:
+            raise ValueError(f"{pygame.event.event_name(event.type)} event has too many fields to be recorded")
+        return self.EVENT.pack(event.type, len(fields)) + b"".join(fields)
+
+    def capture(self, events: Iterable[pygame.event.Event], dt: float):
+        if not 0 <= dt < 2 ** 32 / 1000:
+            raise ValueError(f"frame time {dt} ms can not be recorded")
+        x, y = get_mouse_pos()
+        if not (-2 ** 15 <= x < 2 ** 15 and -2 ** 15 <= y < 2 ** 15):
+            raise ValueError(f"mouse position {(x, y)} can not be recorded")
+        events = list(events)
+        if len(events) >= 2 ** 16:
+            raise ValueError(f"{len(events)} events in one frame can not be recorded")
+
+        pressed = get_mouse_pressed()
+        buttons = 0
+        for i in range(len(pressed)):
+            if pressed[i]:
+                buttons |= 1 << i
+
+        # The whole frame is encoded before anything is written, so a failure never leaves half a frame on disk.
+        frame = [self.FRAME.pack(min(round(dt * 1000), 2 ** 32 - 1), x, y, buttons, len(events))]
+        for event in events:
+            frame.append(self.encode_event(event))
+        self.file.write(b"".join(frame))
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class _EndOfRecording(Exception):
+    pass
+
+
+class _RecordingReader:
+    def __init__(self, data: bytes, offset: int):
+        self.data = data
+        self.offset = offset
+
+    def read(self, length: int) -> bytes:
+        if self.offset + length > len(self.data):
+            raise _EndOfRecording()
+        chunk = self.data[self.offset:self.offset + length]
+        self.offset += length
+        return chunk
+
+    def unpack(self, fmt: Union[str, struct.Struct]) -> tuple:
+        if isinstance(fmt, str):
+            fmt = struct.Struct(fmt)
+        return fmt.unpack(self.read(fmt.size))
+
+    def read_value(self) -> Any:
+        tag = self.read(1)
+        if tag == b"n":
+            return None
+        if tag == b"?":
+            return bool(self.unpack("<B")[0])
+        if tag == b"q":
+            return self.unpack("<q")[0]
+        if tag == b"d":
+            return self.unpack("<d")[0]
+        if tag == b"s":
+            return self.read(self.unpack("<I")[0]).decode("utf-8")
+        if tag == b"t":
+            return tuple(self.read_value() for _ in range(self.unpack("<B")[0]))
+        raise ValueError(f"unknown value tag {tag!r} at byte {self.offset - 1} of the recording")
+
+    def read_event(self) -> pygame.event.Event:
+        event_type, n_fields = self.unpack(InputRecorder.EVENT)
+        fields = {}
+        for _ in range(n_fields):
+            name = self.read(self.unpack("<B")[0]).decode("utf-8")
+            fields[name] = self.read_value()
+        return pygame.event.Event(event_type, fields)
+
+    def read_frame(self) -> InputFrame:
+        dt, x, y, buttons, n_events = self.unpack(InputRecorder.FRAME)
+        events = [self.read_event() for _ in range(n_events)]
+        pressed = (bool(buttons & 1), bool(buttons & 2), bool(buttons & 4))
+        return InputFrame(dt / 1000, (x, y), pressed, events)
+
+
+class InputReplayer:
+    def __init__(self, path: str):
+        with open(path, "rb") as file:
+            data = file.read()
+        if not data.startswith(InputRecorder.MAGIC):
+            raise ValueError(f"'{path}' is not an input recording")
+
+        self.frames = []
+        self.truncated = False
+        reader = _RecordingReader(data, len(InputRecorder.MAGIC))
+        while reader.offset < len(data):
+            try:
+                self.frames.append(reader.read_frame())
+            except _EndOfRecording:
+                # The session ended before the last frame was fully written; keep every complete frame.
+                self.truncated = True
+                break
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __iter__(self):
+        global mouse_in_use, replay_frame
+
+        mouse_in_use = False
+        try:
+            for frame in self.frames:
+                replay_frame = frame
+                yield frame
+        finally:
+            replay_frame = None
+
+    def run(self, step: Callable[[InputFrame], Any]) -> list[float]:
+        timings = []
+        for frame in self:
+            start = time.perf_counter()
+            step(frame)
+            timings.append(time.perf_counter() - start)
+        return timings